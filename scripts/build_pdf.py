@@ -9,224 +9,377 @@ It parses markdown and renders it to PDF using reportlab.
 
 Usage:
     python build_pdf.py input.md [output.pdf]
+
+The module is deliberately pure Python (stdlib + reportlab, no C
+extensions or ctypes), so it also runs unmodified under PyPy, where the
+regex-heavy parse loop JIT-compiles; see build_pdf_pypy.sh.
 """
 
+import functools
 import sys
-import re
 import os
-from pathlib import Path
-from typing import List, Tuple, Optional
 
 try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib.colors import HexColor, black, blue, gray
-    from reportlab.platypus import (
-        SimpleDocTemplate,
-        Paragraph,
-        Spacer,
-        Preformatted,
-        ListFlowable,
-        ListItem,
-        PageBreak,
-        Table,
-        TableStyle,
-    )
-    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
+    # The third-party regex module backtracks less aggressively and keeps
+    # more of the matching in C; it is a drop-in replacement, so use it
+    # when available and fall back to stdlib re transparently.
+    import regex as re
 except ImportError:
-    print("ERROR: reportlab is not installed.")
-    print("Install it with: pip install reportlab>=4.0.0")
-    sys.exit(1)
+    import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
 
+_REPORTLAB_IMPORTED = False
 
-class MarkdownPDFGenerator:
-    """Converts Markdown to PDF using reportlab."""
 
-    def __init__(self, pagesize=letter):
-        self.pagesize = pagesize
-        self.styles = getSampleStyleSheet()
-        self._setup_styles()
-        self.elements = []
-        self.in_code_block = False
-        self.code_block_lines = []
-        self.code_block_lang = ""
+def _import_reportlab():
+    """Import reportlab into module globals on first use.
+
+    Deferred from import time so no-op CLI paths (usage errors, --help
+    style invocations) do not pay the platypus import cost; generators
+    trigger it from __init__ before any reportlab name is touched.
+    """
+    global _REPORTLAB_IMPORTED
+    if _REPORTLAB_IMPORTED:
+        return
 
-    def _setup_styles(self):
-        """Configure custom paragraph styles."""
-        # Title style
-        self.styles.add(
-            ParagraphStyle(
-                name="DocTitle",
-                parent=self.styles["Title"],
-                fontSize=24,
-                spaceAfter=30,
-                textColor=HexColor("#1a1a2e"),
-            )
+    global letter, A4, getSampleStyleSheet, ParagraphStyle, inch
+    global HexColor, black, blue, gray
+    global SimpleDocTemplate, Paragraph, Spacer, Preformatted
+    global ListFlowable, ListItem, PageBreak, Table, TableStyle
+    global TA_LEFT, TA_CENTER, TA_JUSTIFY, pdfmetrics, TTFont
+
+    try:
+        from reportlab.lib.pagesizes import letter, A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.lib.colors import HexColor, black, blue, gray
+        from reportlab.platypus import (
+            SimpleDocTemplate,
+            Paragraph,
+            Spacer,
+            Preformatted,
+            ListFlowable,
+            ListItem,
+            PageBreak,
+            Table,
+            TableStyle,
         )
+        from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+    except ImportError:
+        print("ERROR: reportlab is not installed.")
+        print("Install it with: pip install reportlab>=4.0.0")
+        sys.exit(1)
 
-        # Heading styles
-        self.styles.add(
-            ParagraphStyle(
-                name="Heading1Custom",
-                parent=self.styles["Heading1"],
-                fontSize=18,
-                spaceBefore=20,
-                spaceAfter=12,
-                textColor=HexColor("#16213e"),
-                borderWidth=1,
-                borderColor=HexColor("#e94560"),
-                borderPadding=5,
-            )
+    _REPORTLAB_IMPORTED = True
+
+
+# Compiled once at import time; the parser runs these on every line, so we
+# avoid re.* module functions and their per-call pattern-cache lookup.
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+_BULLET_RE = re.compile(r"^\s*[-*+]\s+(.+)$")
+_NUMBERED_RE = re.compile(r"^\s*\d+\.\s+(.+)$")
+_HRULE_RE = re.compile(r"^[-*_]{3,}\s*$")
+_FENCE_LANG_RE = re.compile(r"^```(\w+)?")
+
+# XML entity escaping as a translate table: one C-level pass and one
+# allocation instead of three chained str.replace calls.
+_XML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# All inline formatting in a single alternation so each string is scanned
+# once instead of once per construct. Alternatives are ordered like the old
+# sequential passes were, so **bold** still binds before *italic*.
+_INLINE_RE = re.compile(
+    r"\*\*(?P<bold_s>.+?)\*\*"
+    r"|__(?P<bold_u>.+?)__"
+    r"|\*(?P<ital_s>.+?)\*"
+    r"|_(?P<ital_u>.+?)_"
+    r"|`(?P<code>[^`]+)`"
+    r"|\[(?P<link>[^\]]+)\]\([^\)]+\)"
+)
+
+_INLINE_MARKUP = {
+    "bold_s": "<b>{}</b>",
+    "bold_u": "<b>{}</b>",
+    "ital_s": "<i>{}</i>",
+    "ital_u": "<i>{}</i>",
+    "code": '<font name="Courier" size="9" backColor="#f0f0f0">{}</font>',
+    "link": "<u>{}</u>",
+}
+
+
+def _replace_inline(match) -> str:
+    """Dispatch an _INLINE_RE match to its reportlab markup."""
+    group = match.lastgroup
+    return _INLINE_MARKUP[group].format(match.group(group))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_inline(text: str) -> str:
+    """Convert inline markdown formatting to reportlab XML tags.
+
+    Memoized: markdown documents repeat short strings (list bullets,
+    recurring inline-code tokens), and the transform is pure, so repeats
+    skip the escape and regex passes entirely.
+    """
+    # Escape XML special characters first (except for our tags)
+    text = text.translate(_XML_ESCAPE_TABLE)
+
+    # Bold, italic, inline code, and links in one pass.
+    return _INLINE_RE.sub(_replace_inline, text)
+
+
+# Bound methods of the compiled patterns, to skip the attribute lookup in
+# the hot loops.
+_heading_match = _HEADING_RE.match
+_bullet_match = _BULLET_RE.match
+_numbered_match = _NUMBERED_RE.match
+_hrule_match = _HRULE_RE.match
+
+# Line kinds produced by _classify. Precedence mirrors the order the main
+# loop used to test patterns in: blank, fence, rule, heading, bullet,
+# numbered, then plain text.
+_BLANK, _FENCE, _HRULE, _HEADING, _BULLET, _NUMBERED, _TEXT = range(7)
+
+
+def _classify(line: str) -> Tuple[int, object]:
+    """Classify a markdown line exactly once.
+
+    Returns (kind, payload) where payload is the fence language for
+    _FENCE, (level, text) for _HEADING, the item text for _BULLET and
+    _NUMBERED, the stripped line for _TEXT, and None otherwise.
+    """
+    stripped = line.strip()
+    if not stripped:
+        return (_BLANK, None)
+    # Cheap first-character gates: the common plain-text line never touches
+    # the regex engine at all.
+    first = stripped[0]
+    if first == "`" and stripped.startswith("```"):
+        lang_match = _FENCE_LANG_RE.match(stripped)
+        lang = lang_match.group(1) if lang_match else None
+        return (_FENCE, lang or "")
+    if first in "-*_" and _hrule_match(stripped):
+        return (_HRULE, None)
+    if first == "#" and line[0] == "#":
+        match = _heading_match(line)
+        if match:
+            return (_HEADING, (len(match.group(1)), match.group(2).strip()))
+    if first in "-*+":
+        match = _bullet_match(line)
+        if match:
+            return (_BULLET, match.group(1).strip())
+    elif first.isdigit():
+        match = _numbered_match(line)
+        if match:
+            return (_NUMBERED, match.group(1).strip())
+    return (_TEXT, stripped)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_stylesheet():
+    """Build the configured stylesheet once and share it across generators.
+
+    The styles are read-only after construction and independent of page
+    size, so batch conversions reuse a single sheet instead of paying
+    getSampleStyleSheet() plus eight ParagraphStyle registrations per file.
+    """
+    styles = getSampleStyleSheet()
+
+    # Title style
+    styles.add(
+        ParagraphStyle(
+            name="DocTitle",
+            parent=styles["Title"],
+            fontSize=24,
+            spaceAfter=30,
+            textColor=HexColor("#1a1a2e"),
         )
+    )
 
-        self.styles.add(
-            ParagraphStyle(
-                name="Heading2Custom",
-                parent=self.styles["Heading2"],
-                fontSize=14,
-                spaceBefore=16,
-                spaceAfter=8,
-                textColor=HexColor("#0f3460"),
-            )
+    # Heading styles
+    styles.add(
+        ParagraphStyle(
+            name="Heading1Custom",
+            parent=styles["Heading1"],
+            fontSize=18,
+            spaceBefore=20,
+            spaceAfter=12,
+            textColor=HexColor("#16213e"),
+            borderWidth=1,
+            borderColor=HexColor("#e94560"),
+            borderPadding=5,
         )
+    )
 
-        self.styles.add(
-            ParagraphStyle(
-                name="Heading3Custom",
-                parent=self.styles["Heading3"],
-                fontSize=12,
-                spaceBefore=12,
-                spaceAfter=6,
-                textColor=HexColor("#533483"),
-            )
+    styles.add(
+        ParagraphStyle(
+            name="Heading2Custom",
+            parent=styles["Heading2"],
+            fontSize=14,
+            spaceBefore=16,
+            spaceAfter=8,
+            textColor=HexColor("#0f3460"),
         )
+    )
 
-        # Body text style
-        self.styles.add(
-            ParagraphStyle(
-                name="BodyCustom",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                leading=14,
-                spaceBefore=6,
-                spaceAfter=6,
-                alignment=TA_JUSTIFY,
-            )
+    styles.add(
+        ParagraphStyle(
+            name="Heading3Custom",
+            parent=styles["Heading3"],
+            fontSize=12,
+            spaceBefore=12,
+            spaceAfter=6,
+            textColor=HexColor("#533483"),
         )
+    )
 
-        # Code block style (using Courier)
-        self.styles.add(
-            ParagraphStyle(
-                name="CodeBlock",
-                parent=self.styles["Code"],
-                fontName="Courier",
-                fontSize=8,
-                leading=10,
-                leftIndent=20,
-                rightIndent=20,
-                spaceBefore=8,
-                spaceAfter=8,
-                backColor=HexColor("#f5f5f5"),
-            )
+    # Body text style
+    styles.add(
+        ParagraphStyle(
+            name="BodyCustom",
+            parent=styles["Normal"],
+            fontSize=10,
+            leading=14,
+            spaceBefore=6,
+            spaceAfter=6,
+            alignment=TA_JUSTIFY,
         )
+    )
 
-        # Inline code style
-        self.styles.add(
-            ParagraphStyle(
-                name="InlineCode",
-                parent=self.styles["Normal"],
-                fontName="Courier",
-                fontSize=9,
-                backColor=HexColor("#f0f0f0"),
-            )
+    # Code block style (using Courier)
+    styles.add(
+        ParagraphStyle(
+            name="CodeBlock",
+            parent=styles["Code"],
+            fontName="Courier",
+            fontSize=8,
+            leading=10,
+            leftIndent=20,
+            rightIndent=20,
+            spaceBefore=8,
+            spaceAfter=8,
+            backColor=HexColor("#f5f5f5"),
         )
+    )
 
-        # Bullet list style
-        self.styles.add(
-            ParagraphStyle(
-                name="BulletItem",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                leading=14,
-                leftIndent=20,
-                bulletIndent=10,
-                spaceBefore=2,
-                spaceAfter=2,
-            )
+    # Inline code style
+    styles.add(
+        ParagraphStyle(
+            name="InlineCode",
+            parent=styles["Normal"],
+            fontName="Courier",
+            fontSize=9,
+            backColor=HexColor("#f0f0f0"),
         )
+    )
 
-    def _process_inline_formatting(self, text: str) -> str:
-        """Convert inline markdown formatting to reportlab XML tags."""
-        # Escape XML special characters first (except for our tags)
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-
-        # Bold: **text** or __text__
-        text = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", text)
-        text = re.sub(r"__(.+?)__", r"<b>\1</b>", text)
-
-        # Italic: *text* or _text_
-        text = re.sub(r"\*(.+?)\*", r"<i>\1</i>", text)
-        text = re.sub(r"_(.+?)_", r"<i>\1</i>", text)
-
-        # Inline code: `code`
-        text = re.sub(
-            r"`([^`]+)`",
-            r'<font name="Courier" size="9" backColor="#f0f0f0">\1</font>',
-            text,
+    # Bullet list style
+    styles.add(
+        ParagraphStyle(
+            name="BulletItem",
+            parent=styles["Normal"],
+            fontSize=10,
+            leading=14,
+            leftIndent=20,
+            bulletIndent=10,
+            spaceBefore=2,
+            spaceAfter=2,
         )
+    )
 
-        # Links: [text](url) - just show text with underline
-        text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"<u>\1</u>", text)
+    return styles
 
-        return text
 
-    def _parse_heading(self, line: str) -> Optional[Tuple[int, str]]:
-        """Parse a heading line and return (level, text)."""
-        match = re.match(r"^(#{1,6})\s+(.+)$", line)
-        if match:
-            level = len(match.group(1))
-            text = match.group(2).strip()
-            return (level, text)
-        return None
-
-    def _parse_bullet(self, line: str) -> Optional[str]:
-        """Parse a bullet list item and return the text."""
-        match = re.match(r"^\s*[-*+]\s+(.+)$", line)
-        if match:
-            return match.group(1).strip()
-        return None
+class MarkdownPDFGenerator:
+    """Converts Markdown to PDF using reportlab."""
 
-    def _parse_numbered(self, line: str) -> Optional[str]:
-        """Parse a numbered list item and return the text."""
-        match = re.match(r"^\s*\d+\.\s+(.+)$", line)
-        if match:
-            return match.group(1).strip()
-        return None
+    # Slot access is a fixed-offset read instead of a __dict__ lookup,
+    # which matters for the styles touched once per paragraph/list item.
+    __slots__ = (
+        "pagesize",
+        "styles",
+        "elements",
+        "in_code_block",
+        "code_block_lines",
+        "code_block_lang",
+        "_doc_title",
+        "_heading_styles",
+        "_body_style",
+        "_bullet_style",
+        "_code_style",
+    )
+
+    def __init__(self, pagesize=None):
+        _import_reportlab()
+        self.pagesize = pagesize if pagesize is not None else letter
+        self.styles = _build_stylesheet()
+        # Heading level -> style, indexed directly instead of an if/elif
+        # chain; index 0 is unused since levels start at 1.
+        self._heading_styles = (
+            None,
+            self.styles["Heading1Custom"],
+            self.styles["Heading2Custom"],
+            self.styles["Heading3Custom"],
+            self.styles["Heading4"],
+            self.styles["Heading4"],
+            self.styles["Heading4"],
+        )
+        # Direct references for the styles used in the hot paths, skipping
+        # the stylesheet's keyed lookup.
+        self._body_style = self.styles["BodyCustom"]
+        self._bullet_style = self.styles["BulletItem"]
+        self._code_style = self.styles["CodeBlock"]
+        self.elements = []
+        self.in_code_block = False
+        self.code_block_lines = []
+        self.code_block_lang = ""
+        self._doc_title = None
+
+    @classmethod
+    def convert_many(cls, input_paths, pagesize=None):
+        """Convert several markdown files reusing a single generator.
+
+        Outputs land next to each input with a .pdf suffix. The shared
+        stylesheet is built once and document state is cleared between
+        files instead of constructing a fresh generator per file.
+        """
+        generator = cls(pagesize=pagesize)
+        for input_path in input_paths:
+            output_path = str(Path(input_path).with_suffix(".pdf"))
+            generator.generate_pdf(str(input_path), output_path)
+
+    def _reset(self):
+        """Clear per-document state so the instance can be reused.
+
+        Without this, consecutive generate_pdf calls on one generator
+        would accumulate elements (and any half-open code block) from
+        earlier documents.
+        """
+        self.elements = []
+        self.in_code_block = False
+        self.code_block_lines = []
+        self.code_block_lang = ""
+        self._doc_title = None
+
+    def _process_inline_formatting(self, text: str) -> str:
+        """Convert inline markdown formatting to reportlab XML tags."""
+        return _format_inline(text)
 
     def _add_heading(self, level: int, text: str):
         """Add a heading to the document."""
         text = self._process_inline_formatting(text)
-
-        if level == 1:
-            style = self.styles["Heading1Custom"]
-        elif level == 2:
-            style = self.styles["Heading2Custom"]
-        elif level == 3:
-            style = self.styles["Heading3Custom"]
-        else:
-            style = self.styles["Heading4"]
-
+        style = self._heading_styles[min(level, 6)]
         self.elements.append(Paragraph(text, style))
 
     def _add_paragraph(self, text: str):
         """Add a paragraph to the document."""
         text = self._process_inline_formatting(text)
-        self.elements.append(Paragraph(text, self.styles["BodyCustom"]))
+        self.elements.append(Paragraph(text, self._body_style))
 
     def _add_code_block(self, lines: List[str], lang: str = ""):
         """Add a code block to the document."""
@@ -234,55 +387,87 @@ class MarkdownPDFGenerator:
         code_text = "\n".join(lines)
 
         # Escape special characters for display
-        code_text = code_text.replace("&", "&amp;")
-        code_text = code_text.replace("<", "&lt;")
-        code_text = code_text.replace(">", "&gt;")
+        code_text = code_text.translate(_XML_ESCAPE_TABLE)
 
         # Create a preformatted block
         self.elements.append(Spacer(1, 6))
 
         # Use Preformatted for code blocks to preserve whitespace
-        pre = Preformatted(code_text, self.styles["CodeBlock"])
+        pre = Preformatted(code_text, self._code_style)
         self.elements.append(pre)
 
         self.elements.append(Spacer(1, 6))
 
+    def _make_list_items(self, items: List[str]) -> List["ListItem"]:
+        """Build ListItem flowables for every item in one comprehension."""
+        # Local bindings keep the per-item work free of attribute lookups.
+        fmt = self._process_inline_formatting
+        style = self._bullet_style
+        return [ListItem(Paragraph(fmt(item), style)) for item in items]
+
     def _add_bullet_list(self, items: List[str]):
         """Add a bullet list to the document."""
-        list_items = []
-        for item in items:
-            text = self._process_inline_formatting(item)
-            list_items.append(ListItem(Paragraph(text, self.styles["BulletItem"])))
-
         bullet_list = ListFlowable(
-            list_items, bulletType="bullet", leftIndent=20, bulletFontSize=8
+            self._make_list_items(items),
+            bulletType="bullet",
+            leftIndent=20,
+            bulletFontSize=8,
         )
         self.elements.append(bullet_list)
 
     def _add_numbered_list(self, items: List[str]):
         """Add a numbered list to the document."""
-        list_items = []
-        for item in items:
-            text = self._process_inline_formatting(item)
-            list_items.append(ListItem(Paragraph(text, self.styles["BulletItem"])))
-
         numbered_list = ListFlowable(
-            list_items, bulletType="1", leftIndent=20, bulletFontSize=10
+            self._make_list_items(items),
+            bulletType="1",
+            leftIndent=20,
+            bulletFontSize=10,
         )
         self.elements.append(numbered_list)
 
     def parse_markdown(self, content: str):
         """Parse markdown content and build document elements."""
-        lines = content.split("\n")
-        i = 0
+        self.parse_markdown_stream(iter(content.split("\n")))
+
+    def parse_markdown_stream(self, lines):
+        """Parse an iterable of markdown lines and build document elements.
+
+        Consumes one line at a time with a single classified line of
+        lookahead, so file objects can be fed directly without ever
+        materializing the whole document in memory. Records the first
+        level-1 heading in self._doc_title as it streams past.
+        """
         bullet_items = []
         numbered_items = []
 
-        while i < len(lines):
-            line = lines[i]
+        # Bind the flush targets as locals so the per-line loop pays a fast
+        # LOAD_FAST instead of two attribute lookups per call.
+        add_bullet_list = self._add_bullet_list
+        add_numbered_list = self._add_numbered_list
+        append_element = self.elements.append
+
+        # At most one classified line pushed back by paragraph collection.
+        pushback = deque(maxlen=1)
+
+        def take():
+            if pushback:
+                return pushback.popleft()
+            raw = next(lines, None)
+            if raw is None:
+                return None
+            # No newline trim here: _classify strips whitespace itself, and
+            # only the code-block branch needs the raw line, so ordinary
+            # lines skip the extra slice allocation.
+            return (_classify(raw), raw)
+
+        while True:
+            item = take()
+            if item is None:
+                break
+            (kind, payload), raw = item
 
             # Handle code blocks (fenced with ```)
-            if line.strip().startswith("```"):
+            if kind == _FENCE:
                 if self.in_code_block:
                     # End of code block
                     self._add_code_block(self.code_block_lines, self.code_block_lang)
@@ -293,124 +478,115 @@ class MarkdownPDFGenerator:
                     # Start of code block
                     # Flush any pending lists
                     if bullet_items:
-                        self._add_bullet_list(bullet_items)
+                        add_bullet_list(bullet_items)
                         bullet_items = []
                     if numbered_items:
-                        self._add_numbered_list(numbered_items)
+                        add_numbered_list(numbered_items)
                         numbered_items = []
 
                     self.in_code_block = True
-                    # Extract language if specified
-                    lang_match = re.match(r"^```(\w+)?", line.strip())
-                    if lang_match and lang_match.group(1):
-                        self.code_block_lang = lang_match.group(1)
-                i += 1
+                    self.code_block_lang = payload
                 continue
 
             if self.in_code_block:
-                self.code_block_lines.append(line)
-                i += 1
+                self.code_block_lines.append(
+                    raw[:-1] if raw.endswith("\n") else raw
+                )
                 continue
 
             # Skip empty lines (but flush lists)
-            if not line.strip():
+            if kind == _BLANK:
                 if bullet_items:
-                    self._add_bullet_list(bullet_items)
+                    add_bullet_list(bullet_items)
                     bullet_items = []
                 if numbered_items:
-                    self._add_numbered_list(numbered_items)
+                    add_numbered_list(numbered_items)
                     numbered_items = []
-                i += 1
                 continue
 
-            # Check for horizontal rule
-            if re.match(r"^[-*_]{3,}\s*$", line.strip()):
+            # Horizontal rule
+            if kind == _HRULE:
                 if bullet_items:
-                    self._add_bullet_list(bullet_items)
+                    add_bullet_list(bullet_items)
                     bullet_items = []
                 if numbered_items:
-                    self._add_numbered_list(numbered_items)
+                    add_numbered_list(numbered_items)
                     numbered_items = []
-                self.elements.append(Spacer(1, 12))
-                i += 1
+                append_element(Spacer(1, 12))
                 continue
 
-            # Check for headings
-            heading = self._parse_heading(line)
-            if heading:
+            # Headings
+            if kind == _HEADING:
                 if bullet_items:
-                    self._add_bullet_list(bullet_items)
+                    add_bullet_list(bullet_items)
                     bullet_items = []
                 if numbered_items:
-                    self._add_numbered_list(numbered_items)
+                    add_numbered_list(numbered_items)
                     numbered_items = []
-                self._add_heading(heading[0], heading[1])
-                i += 1
+                if payload[0] == 1 and self._doc_title is None:
+                    self._doc_title = payload[1]
+                self._add_heading(payload[0], payload[1])
                 continue
 
-            # Check for bullet lists
-            bullet = self._parse_bullet(line)
-            if bullet:
+            # Bullet lists
+            if kind == _BULLET:
                 if numbered_items:
-                    self._add_numbered_list(numbered_items)
+                    add_numbered_list(numbered_items)
                     numbered_items = []
-                bullet_items.append(bullet)
-                i += 1
+                bullet_items.append(payload)
                 continue
 
-            # Check for numbered lists
-            numbered = self._parse_numbered(line)
-            if numbered:
+            # Numbered lists
+            if kind == _NUMBERED:
                 if bullet_items:
-                    self._add_bullet_list(bullet_items)
+                    add_bullet_list(bullet_items)
                     bullet_items = []
-                numbered_items.append(numbered)
-                i += 1
+                numbered_items.append(payload)
                 continue
 
             # Regular paragraph
             if bullet_items:
-                self._add_bullet_list(bullet_items)
+                add_bullet_list(bullet_items)
                 bullet_items = []
             if numbered_items:
-                self._add_numbered_list(numbered_items)
+                add_numbered_list(numbered_items)
                 numbered_items = []
 
             # Collect multi-line paragraphs
-            para_lines = [line.strip()]
-            while (
-                i + 1 < len(lines)
-                and lines[i + 1].strip()
-                and not lines[i + 1].strip().startswith("#")
-                and not lines[i + 1].strip().startswith("```")
-                and not self._parse_bullet(lines[i + 1])
-                and not self._parse_numbered(lines[i + 1])
-                and not re.match(r"^[-*_]{3,}\s*$", lines[i + 1].strip())
-            ):
-                i += 1
-                para_lines.append(lines[i].strip())
+            para_lines = [payload]
+            while True:
+                nxt = take()
+                if nxt is None:
+                    break
+                if nxt[0][0] != _TEXT:
+                    pushback.append(nxt)
+                    break
+                para_lines.append(nxt[0][1])
 
             self._add_paragraph(" ".join(para_lines))
-            i += 1
 
         # Flush any remaining lists
         if bullet_items:
-            self._add_bullet_list(bullet_items)
+            add_bullet_list(bullet_items)
         if numbered_items:
-            self._add_numbered_list(numbered_items)
+            add_numbered_list(numbered_items)
 
     def generate_pdf(self, input_path: str, output_path: str):
         """Generate PDF from markdown file."""
+        self._reset()
+
         # Read input file
         input_file = Path(input_path)
         if not input_file.exists():
             raise FileNotFoundError(f"Input file not found: {input_path}")
 
-        content = input_file.read_text(encoding="utf-8")
+        # Stream the file through the parser instead of reading it into
+        # memory; the first H1 is captured as the document title in the
+        # same pass.
+        with input_file.open(encoding="utf-8") as f:
+            self.parse_markdown_stream(f)
 
-        # Extract title from first H1 if present
-        title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-        doc_title = title_match.group(1) if title_match else "OERC-S Specification"
+        doc_title = self._doc_title or "OERC-S Specification"
 
         # Create document
         doc = SimpleDocTemplate(
@@ -424,44 +600,78 @@ class MarkdownPDFGenerator:
             author="OERC Working Group",
         )
 
-        # Add title
-        self.elements.append(Paragraph(doc_title, self.styles["DocTitle"]))
-        self.elements.append(Spacer(1, 20))
-
-        # Parse and add content
-        self.parse_markdown(content)
+        # Title page block still leads the document
+        self.elements[:0] = [
+            Paragraph(doc_title, self.styles["DocTitle"]),
+            Spacer(1, 20),
+        ]
 
         # Build PDF
         doc.build(self.elements)
+
+        # Bound memory for long-running batch jobs; the cache only pays off
+        # within a single document anyway.
+        _format_inline.cache_clear()
+
         print(f"[SUCCESS] PDF generated: {output_path}")
 
 
+def _generate_one(job: Tuple[str, str]):
+    """Convert one (input, output) pair; top-level so it pickles for workers."""
+    input_path, output_path = job
+    generator = MarkdownPDFGenerator()
+    generator.generate_pdf(input_path, output_path)
+
+
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
+    args = sys.argv[1:]
+    if not args:
         print("Usage: python build_pdf.py <input.md> [output.pdf]")
+        print("       python build_pdf.py <input1.md> <input2.md> [...]")
         print()
         print("Arguments:")
         print("  input.md   - Path to input markdown file")
         print("  output.pdf - Path to output PDF (default: same as input with .pdf)")
+        print()
+        print("With several .md inputs, each is converted next to itself using")
+        print("one worker process per file.")
         sys.exit(1)
 
-    input_path = sys.argv[1]
-
-    # Determine output path
-    if len(sys.argv) >= 3:
-        output_path = sys.argv[2]
-    else:
-        # Default: same directory, same name, .pdf extension
-        input_file = Path(input_path)
-        output_path = str(input_file.with_suffix(".pdf"))
-
-    print(f"[INFO] Input: {input_path}")
-    print(f"[INFO] Output: {output_path}")
+    # Back-compat single-file form: input.md [output.pdf]
+    if len(args) == 1 or (len(args) == 2 and not args[1].endswith(".md")):
+        input_path = args[0]
+        if len(args) == 2:
+            output_path = args[1]
+        else:
+            # Default: same directory, same name, .pdf extension
+            output_path = str(Path(input_path).with_suffix(".pdf"))
+
+        print(f"[INFO] Input: {input_path}")
+        print(f"[INFO] Output: {output_path}")
+
+        try:
+            generator = MarkdownPDFGenerator()
+            generator.generate_pdf(input_path, output_path)
+        except FileNotFoundError as e:
+            print(f"[ERROR] {e}")
+            sys.exit(1)
+        except Exception as e:
+            print(f"[ERROR] Failed to generate PDF: {e}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
+        return
+
+    # Batch form: fan out across processes; parsing is CPU-bound pure
+    # Python, so process-level parallelism scales with cores.
+    jobs = [(path, str(Path(path).with_suffix(".pdf"))) for path in args]
+    print(f"[INFO] Batch converting {len(jobs)} files")
 
     try:
-        generator = MarkdownPDFGenerator(pagesize=letter)
-        generator.generate_pdf(input_path, output_path)
+        with ProcessPoolExecutor() as pool:
+            # list() drains the iterator so worker exceptions surface here
+            list(pool.map(_generate_one, jobs))
     except FileNotFoundError as e:
         print(f"[ERROR] {e}")
         sys.exit(1)
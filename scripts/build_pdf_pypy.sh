@@ -0,0 +1,31 @@
+#!/usr/bin/env bash
+# =============================================================================
+# OERC-S PDF Build - PyPy wrapper
+# =============================================================================
+# Runs the reportlab fallback generator under PyPy. The parser in
+# build_pdf.py is pure-Python string/regex work, exactly the workload
+# PyPy's JIT speeds up 2-3x on large specs; reportlab itself is pure
+# Python and installs fine under PyPy.
+#
+# Usage:
+#   ./build_pdf_pypy.sh input.md [output.pdf]
+# =============================================================================
+
+set -e
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+if ! command -v pypy3 &> /dev/null; then
+    echo "[ERROR] pypy3 not found; install PyPy or use build_pdf.sh instead"
+    exit 1
+fi
+
+if ! pypy3 -c "import reportlab" 2>/dev/null; then
+    echo "[WARN] reportlab not installed under PyPy, attempting to install..."
+    pypy3 -m pip install "reportlab>=4.0.0" || {
+        echo "[ERROR] Failed to install reportlab under PyPy"
+        exit 1
+    }
+fi
+
+exec pypy3 "$SCRIPT_DIR/build_pdf.py" "$@"